@@ -0,0 +1,69 @@
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+from eth_typing import ChecksumAddress
+from web3 import Web3
+
+#: Settings file next to the scripts, see ``.env.example``
+ENV_PATH = Path(__file__).resolve().parent / ".env"
+
+
+def read_env_file(path: Path) -> dict[str, str]:
+    """Read ``KEY=value`` lines from an env file.
+
+    Follows the python-dotenv conventions the ``.env`` files are written for:
+
+    - Blank lines and ``#`` comment lines are skipped
+
+    - An optional ``export`` prefix is ignored
+
+    - A value in matching single or double quotes is taken as is, between the quotes
+
+    - In unquoted values, ``#`` preceded by whitespace starts an inline comment
+
+    :param path:
+        Env file path
+
+    :return:
+        Settings as a dict, empty if the file does not exist
+    """
+    if not path.exists():
+        return {}
+
+    values = {}
+    with open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("export "):
+                line = line[len("export ") :].lstrip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            values[key.strip()] = _parse_env_value(value.strip())
+    return values
+
+
+def _parse_env_value(value: str) -> str:
+    if value[:1] in ("'", '"'):
+        closing = value.find(value[0], 1)
+        if closing != -1:
+            # Anything after the closing quote can only be a comment
+            return value[1:closing]
+    return re.split(r"\s+#", value, maxsplit=1)[0]
+
+
+def _address(value: Optional[str]) -> Optional[ChecksumAddress]:
+    return Web3.to_checksum_address(value) if value else None
+
+
+#: Settings from ``.env``, the process environment takes precedence
+_env = read_env_file(ENV_PATH) | os.environ
+
+JSON_RPC: Optional[str] = _env.get("JSON_RPC")
+PRIVATE_KEY: Optional[str] = _env.get("PRIVATE_KEY")
+SWAP_ROUTER: Optional[ChecksumAddress] = _address(_env.get("SWAP_ROUTER"))
+QUOTER: Optional[ChecksumAddress] = _address(_env.get("QUOTER"))
+QUOTE_TOKEN: Optional[ChecksumAddress] = _address(_env.get("QUOTE_TOKEN"))
+BASE_TOKEN: Optional[ChecksumAddress] = _address(_env.get("BASE_TOKEN"))
@@ -1,16 +1,28 @@
 import json
-import cachetools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import lru
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from eth_abi.exceptions import DecodingError
 from eth_tester.exceptions import TransactionFailed
+from hexbytes import HexBytes
+from web3._utils.abi import get_abi_output_types
+from web3._utils.request import cache_and_return_session, make_post_request
 from web3.exceptions import BadFunctionCallOutput, ContractLogicError
 from pathlib import Path
-from decimal import Decimal
-from functools import lru_cache, cached_property
-from dataclasses import dataclass
-from typing import Optional, Union
-from eth_typing import HexAddress
-from web3 import Web3
+from decimal import ROUND_DOWN, Decimal
+from functools import cached_property, lru_cache, partial
+from dataclasses import dataclass, field
+from typing import MutableMapping, Optional, Union
+from eth_typing import ChecksumAddress, HexAddress
+from web3 import HTTPProvider, Web3
 from web3.contract import Contract
 
+from token_store import DEFAULT_TOKEN_STORE, TokenDetailStore
+
 @lru_cache(maxsize=512)
 def get_abi_by_filename(fname: str) -> dict:
     """Reads a embedded ABI file and returns it.
@@ -32,20 +44,109 @@ def get_abi_by_filename(fname: str) -> dict:
 
     here = Path(__file__).resolve().parent
     abi_path = here / "abi" / Path(fname)
-    with open(abi_path, "rt", encoding="utf-8") as f:
-        abi = json.load(f)
+    with open(abi_path, "rb") as f:
+        data = f.read()
+    # orjson parses several times faster than stdlib json
+    abi = orjson.loads(data) if orjson else json.loads(data)
     return abi
 
+
+def get_contract_factory(web3: Web3, fname: str) -> type[Contract]:
+    """Get a contract class for an embedded ABI file.
+
+    Building a contract class walks the whole ABI,
+    so it is done only once per Web3 instance and ABI file.
+
+    The classes are cached on the Web3 instance itself.
+    Each class refers back to its Web3 instance, so a module level cache,
+    even a :py:class:`weakref.WeakKeyDictionary`, would keep every Web3 instance alive.
+
+    Example::
+
+        ERC20 = get_contract_factory(web3, "ERC20.json")
+        usdc = ERC20(address=usdc_address)
+
+    :param web3: Web3 instance
+    :param fname: ABI JSON filename, see :py:func:`get_abi_by_filename`
+    :return: Contract class without an address
+    """
+    factories = web3.__dict__.setdefault("_contract_factories", {})
+    factory = factories.get(fname)
+    if factory is None:
+        factory = factories[fname] = web3.eth.contract(abi=get_abi_by_filename(fname))
+    return factory
+
 #: By default we cache 1024 token details using LRU.
 #:
-#:
-DEFAULT_TOKEN_CACHE = cachetools.LRUCache(1024)
+#: :py:class:`lru.LRU` keeps the LRU bookkeeping in C, so a cache hit
+#: is a single native call instead of pure Python linked list updates.
+DEFAULT_TOKEN_CACHE = lru.LRU(1024)
+
+#: Chain id of each Web3 connection, so we do ``eth_chainId`` only once per connection
+_chain_id_cache = weakref.WeakKeyDictionary()
 
 #: List of exceptions JSON-RPC provider can through when ERC-20 field look-up fails
 #: TODO: Add exceptios from real HTTPS/WSS providers
 #: `ValueError` is raised by Ganache
 _call_missing_exceptions = (TransactionFailed, BadFunctionCallOutput, ValueError, ContractLogicError)
 
+#: Largest uint256 value, used for unlimited ERC-20 approvals
+MAX_UINT256 = (1 << 256) - 1
+
+#: Multicall3 is deployed at the same address on most EVM chains
+#:
+#: See https://www.multicall3.com/deployments
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+#: Chain ids where we found no Multicall3 deployment and fall back to JSON-RPC batching
+_multicall_missing_chains: set[int] = set()
+
+#: How many tokens to read in one Multicall3 call,
+#: keeps ``eth_call`` within node gas and response size limits
+MULTICALL_CHUNK_SIZE = 100
+
+#: How many keep-alive connections we hold open to the JSON-RPC node
+POOL_SIZE = 64
+
+#: How many Multicall3 calls to run in parallel threads
+DEFAULT_MAX_WORKERS = 16
+
+#: ERC-20 functions read by :py:func:`fetch_erc20_details`, in the order they are batched
+_ERC20_DETAIL_FUNCTIONS = ("symbol", "name", "decimals")
+
+
+@lru_cache(maxsize=4096)
+def to_checksum_address(address: Union[HexAddress, str]) -> ChecksumAddress:
+    """Convert an address to EIP-55 checksummed form.
+
+    Checksumming hashes the address with keccak256,
+    so results are cached for the addresses we see over and over.
+
+    :param address:
+        Address in any letter case
+
+    :return:
+        Checksummed address
+    """
+    return Web3.to_checksum_address(address)
+
+
+def get_chain_id(web3: Web3) -> int:
+    """Get the chain id of a Web3 connection.
+
+    The chain id is read with ``eth_chainId`` on the first call
+    and cached for the lifetime of the Web3 instance.
+
+    :param web3:
+        Web3 instance
+
+    :return:
+        EVM chain id
+    """
+    chain_id = _chain_id_cache.get(web3)
+    if chain_id is None:
+        chain_id = _chain_id_cache[web3] = web3.eth.chain_id
+    return chain_id
 
 
 @dataclass
@@ -76,12 +177,21 @@ class TokenDetails:
     #: Token symbol e.g. ``USDC``
     symbol: Optional[str] = None
 
-    #: Token supply as raw units
-    total_supply: Optional[int] = None
-
     #: Number of decimals
     decimals: Optional[int] = None
 
+    #: The EVM chain id where this token lives.
+    #:
+    #: Resolved from the contract's Web3 connection if not given.
+    #:
+    #: Keyword-only, so positional calls written for the old
+    #: ``(contract, name, symbol, total_supply, decimals)`` order fail loudly.
+    chain_id: Optional[int] = field(default=None, kw_only=True)
+
+    def __post_init__(self):
+        if self.chain_id is None:
+            self.chain_id = get_chain_id(self.contract.w3)
+
     def __eq__(self, other):
         """Token is the same if it's on the same chain and has the same contract address."""
         assert isinstance(other, TokenDetails)
@@ -95,9 +205,32 @@ class TokenDetails:
         return f"<{self.name} ({self.symbol}) at {self.contract.address}, {self.decimals} decimals, on chain {self.chain_id}>"
 
     @cached_property
-    def chain_id(self) -> int:
-        """The EVM chain id where this token lives."""
-        return self.contract.w3.eth.chain_id
+    def total_supply(self) -> Optional[int]:
+        """Token supply as raw units.
+
+        Not needed for most operations, so it is read with
+        ``totalSupply()`` RPC call only on the first access.
+
+        ``None`` if the token does not implement ``totalSupply()``.
+
+        Unlike the fields read by :py:func:`fetch_erc20_details`,
+        errors are never raised here regardless of its ``raise_on_error``,
+        any call failure gives ``None``.
+        """
+        try:
+            return self.contract.functions.totalSupply().call()
+        except _call_missing_exceptions:
+            return None
+
+    @cached_property
+    def _scale(self) -> int:
+        """Raw units in one whole token."""
+        return 10**self.decimals
+
+    @cached_property
+    def _decimal_scale(self) -> Decimal:
+        """Raw units in one whole token, as a decimal."""
+        return Decimal(self._scale)
 
     @property
     def address(self) -> HexAddress:
@@ -116,7 +249,7 @@ class TokenDetails:
             assert details.convert_to_decimals(1) == Decimal("0.0000000000000001")
 
         """
-        return Decimal(raw_amount) / Decimal(10**self.decimals)
+        return Decimal(raw_amount) / self._decimal_scale
 
     def convert_to_raw(self, decimal_amount: Decimal) -> int:
         """Convert decimalised token amount to raw uint256.
@@ -129,8 +262,11 @@ class TokenDetails:
             # Convert 1.0 USDC to raw unit with 6 decimals
             assert details.convert_to_raw(1) == 1_000_000
 
+        Fractions smaller than one raw unit are rounded down.
         """
-        return int(decimal_amount * 10**self.decimals)
+        if isinstance(decimal_amount, int):
+            return decimal_amount * self._scale
+        return int((Decimal(decimal_amount) * self._scale).to_integral_value(rounding=ROUND_DOWN))
 
     def fetch_balance_of(self, address: HexAddress | str, block_identifier="latest") -> Decimal:
         """Get an address token balance.
@@ -145,143 +281,510 @@ class TokenDetails:
         return self.convert_to_decimals(raw_amount)
 
     @staticmethod
-    def generate_cache_key(chain_id: int, address: str) -> int:
+    def generate_cache_key(chain_id: int, address: ChecksumAddress) -> tuple[int, ChecksumAddress]:
         """Generate a cache key for this token.
 
         - Cached by (chain, address) tuple
 
-        - Validate the inputs before generating the key
+        - Inputs are not validated, this is on the cache lookup fast path
+
+        :param address:
+            Checksummed address, see :py:func:`to_checksum_address`
         """
-        assert type(chain_id) == int
-        assert type(address) == str
-        assert address.startswith("0x")
-        return hash((chain_id, address.lower()))
+        return chain_id, address
 
 
 
-def fetch_erc20_details(
+def _rpc_result(response: dict):
+    """Unwrap a raw JSON-RPC response to its result, or a :py:class:`ValueError` carrying the error."""
+    return ValueError(response["error"]) if "error" in response else response["result"]
+
+
+def batch_rpc_request(
     web3: Web3,
-    token_address: Union[HexAddress, str],
-    max_str_length: int = 256,
-    raise_on_error=True,
-    cache: cachetools.Cache | None = DEFAULT_TOKEN_CACHE,
-    chain_id: int = None,
-) -> TokenDetails:
-    """Read token details from on-chain data.
+    requests: list[tuple[str, list]],
+) -> list:
+    """Do several JSON-RPC calls in a single HTTP request.
 
-    Connect to Web3 node and do RPC calls to extract the token info.
-    We apply some sanitazation for incoming data, like length checks and removal of null bytes.
+    web3.py v6 does not expose JSON-RPC batching, so we post the batch ourselves.
+    Providers with their own shared ``session``, like :py:class:`rpc.PooledHTTPProvider`,
+    are posted through it, otherwise through the session web3.py has cached for the endpoint.
+    Results are raw JSON-RPC values, they do not go through web3 middleware or formatters.
 
-    The function should not raise an exception as long as the underlying node connection does not fail.
+    Non-HTTP providers (IPC, WebSocket, EthereumTester) and nodes that do not accept batches
+    get one ``provider.make_request()`` per call instead, also bypassing middleware.
 
     Example:
 
     .. code-block:: python
 
-        details = fetch_erc20_details(web3, token_address)
-        assert details.name == "Hentai books token"
-        assert details.decimals == 6
+        block_number, gas_price = batch_rpc_request(web3, [("eth_blockNumber", []), ("eth_gasPrice", [])])
 
     :param web3:
         Web3 instance
 
-    :param token_address:
-        ERC-20 contract address:
+    :param requests:
+        List of (method, params) tuples
 
-    :param max_str_length:
-        For input sanitisation
+    :return:
+        Result of each request, in the order of ``requests``.
+        Requests the node rejected are returned as :py:class:`ValueError` instances
+        carrying the JSON-RPC error.
+    """
+    provider = web3.provider
+
+    responses = None
+    if isinstance(provider, HTTPProvider):
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": idx,
+                "method": method,
+                "params": params,
+            }
+            for idx, (method, params) in enumerate(requests)
+        ]
+        session = getattr(provider, "session", None)
+        if session is not None:
+            response = session.post(provider.endpoint_uri, data=json.dumps(payload), **provider.get_request_kwargs())
+            response.raise_for_status()
+            raw_response = response.content
+        else:
+            raw_response = make_post_request(provider.endpoint_uri, json.dumps(payload), **provider.get_request_kwargs())
+        responses = json.loads(raw_response)
+
+        if isinstance(responses, list):
+            responses = sorted(responses, key=lambda r: r["id"])
+        else:
+            # Node refused the whole batch, e.g. batching not supported
+            responses = None
+
+    if responses is None:
+        responses = [provider.make_request(method, params) for method, params in requests]
+
+    return [_rpc_result(response) for response in responses]
+
+
+def _eth_call(
+    web3: Web3,
+    to: HexAddress,
+    data: str,
+    block_identifier="latest",
+) -> HexBytes | Exception:
+    """Do a single ``eth_call`` in one request.
 
-    :param raise_on_error:
-        If set, raise `TokenDetailError` on any error instead of silently ignoring in and setting details to None.
+    Over HTTP the call is sent with ``provider.make_request()``,
+    skipping web3 validation middleware and its extra ``eth_chainId`` round-trip.
+    Other providers go through ``web3.eth.call()``, as their middleware may need to fill in
+    transaction defaults, e.g. EthereumTester requires ``from``.
 
-    :param cache:
-        Use this cache for cache token detail calls.
+    :return:
+        Raw return data, or the exception if the node rejected the call
+    """
+    provider = web3.provider
+    if isinstance(provider, HTTPProvider):
+        response = provider.make_request("eth_call", [{"to": to, "data": data}, block_identifier])
+        result = _rpc_result(response)
+        return _eth_call_error(result) if isinstance(result, ValueError) else HexBytes(result)
 
-        The main purpose is to easily reduce JSON-RPC API call count.
+    try:
+        return web3.eth.call({"to": to, "data": data}, block_identifier)
+    except _call_missing_exceptions as e:
+        return e
 
-        By default, we use LRU cache of 1024 entries.
 
-        Set to ``None`` to disable the cache.
+def _eth_call_error(error: ValueError) -> ContractLogicError:
+    """Convert a JSON-RPC error of ``eth_call`` to :py:class:`ContractLogicError`."""
+    error = error.args[0]
+    if isinstance(error, dict):
+        return ContractLogicError(error.get("message"), data=error.get("data"))
+    return ContractLogicError(str(error))
 
-        Instance of :py:class:`cachetools.Cache'.
-        See `cachetools documentation for details <https://cachetools.readthedocs.io/en/latest/#cachetools.LRUCache>`__.
 
-    :param chain_id:
-        Chain id hint for the cache.
+def _batch_eth_call(
+    web3: Web3,
+    calls: list[tuple[HexAddress, str]],
+    block_identifier="latest",
+) -> list[HexBytes | Exception]:
+    """Do several ``eth_call`` in a single JSON-RPC batch request.
+
+    Non-HTTP providers get one :py:func:`_eth_call` per call.
 
-        If not given do ``eth_chainId`` RPC call to figure out.
+    :param web3:
+        Web3 instance
+
+    :param calls:
+        List of (contract address, ABI encoded call data) tuples
+
+    :param block_identifier:
+        Block to query
 
     :return:
-        Sanitised token info
+        Raw return data for each call, in the order of ``calls``.
+        Calls the node rejected are returned as :py:class:`ContractLogicError` instances.
     """
+    if not isinstance(web3.provider, HTTPProvider):
+        # No batching outside HTTP, see _eth_call() why we do not use batch_rpc_request() fallback here
+        return [_eth_call(web3, to, data, block_identifier) for to, data in calls]
 
-    if not chain_id:
-        chain_id = web3.eth.chain_id
+    responses = batch_rpc_request(
+        web3,
+        [("eth_call", [{"to": to, "data": data}, block_identifier]) for to, data in calls],
+    )
+    return [
+        _eth_call_error(response) if isinstance(response, ValueError) else HexBytes(response)
+        for response in responses
+    ]
 
-    address = Web3.to_checksum_address(token_address)
 
-    erc_20 = web3.eth.contract(abi=get_abi_by_filename('ERC20.json'), address=address)
-    key = TokenDetails.generate_cache_key(chain_id, token_address)
+def decode_call_result(contract: Contract, fn_name: str, result: HexBytes | str | Exception):
+    """Decode a raw ``eth_call`` result the same way ``ContractFunction.call()`` would.
 
-    if cache is not None:
-        cached = cache.get(key)
-        if cached is not None:
-            return TokenDetails(
-                erc_20,
-                cached["name"],
-                cached["symbol"],
-                cached["supply"],
-                cached["decimals"],
-            )
+    Only the first return value is returned,
+    e.g. ``amountOut`` for ``quoteExactInputSingle()``.
+
+    :raise BadFunctionCallOutput:
+        If the call returned no data or data not matching the ABI.
+
+    :raise ContractLogicError:
+        If the call was rejected by the node.
+    """
+    if isinstance(result, Exception):
+        raise result
+
+    result = HexBytes(result)
+    if not result:
+        raise BadFunctionCallOutput(f"Could not decode {fn_name}() output: call returned no data")
+
+    fn_abi = contract.get_function_by_name(fn_name).abi
     try:
-        symbol = erc_20.functions.symbol().call()[0:max_str_length]
+        decoded = contract.w3.codec.decode(get_abi_output_types(fn_abi), result)
+    except DecodingError as e:
+        raise BadFunctionCallOutput(f"Could not decode {fn_name}() output: {result.hex()}") from e
+    return decoded[0]
+
+
+def _aggregate3(
+    web3: Web3,
+    calls: list[tuple[HexAddress, str]],
+    block_identifier="latest",
+) -> list[HexBytes | Exception]:
+    """Do several calls in a single ``eth_call`` through Multicall3 ``aggregate3``.
+
+    Every call is made with ``allowFailure``, so one reverting call
+    does not fail the others.
+
+    The ``eth_call`` is sent with :py:func:`_eth_call` as a plain request,
+    bypassing web3 middleware that would do an extra ``eth_chainId`` round-trip first.
+
+    :param web3:
+        Web3 instance
+
+    :param calls:
+        List of (contract address, ABI encoded call data) tuples
+
+    :param block_identifier:
+        Block to query
+
+    :raise BadFunctionCallOutput:
+        If Multicall3 is not deployed on the chain
+
+    :return:
+        Raw return data for each call, in the order of ``calls``.
+        Reverted calls are returned as :py:class:`ContractLogicError` instances.
+    """
+    multicall = get_contract(web3, MULTICALL3_ADDRESS, "Multicall3.json")
+    call3s = [(to, True, HexBytes(data)) for to, data in calls]
+    call_data = multicall.encode_abi(fn_name="aggregate3", args=[call3s])
+    raw_result = _eth_call(web3, multicall.address, call_data, block_identifier)
+    results = decode_call_result(multicall, "aggregate3", raw_result)
+    return [
+        HexBytes(return_data) if success else ContractLogicError(f"Call to {to} reverted", data=HexBytes(return_data).hex())
+        for (to, _), (success, return_data) in zip(calls, results)
+    ]
+
+
+def _fetch_erc20_results(
+    web3: Web3,
+    chain_id: int,
+    erc_20s: list[Contract],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[list[HexBytes | Exception]]:
+    """Read raw ERC-20 detail call results for any number of tokens.
+
+    Tokens are split to chunks of :py:data:`MULTICALL_CHUNK_SIZE`
+    and the chunks are fetched in parallel threads,
+    at most :py:data:`POOL_SIZE` so workers do not wait for pooled connections.
+
+    :return:
+        Raw results for :py:data:`_ERC20_DETAIL_FUNCTIONS`, one list per token
+    """
+    chunks = [erc_20s[idx : idx + MULTICALL_CHUNK_SIZE] for idx in range(0, len(erc_20s), MULTICALL_CHUNK_SIZE)]
+    if len(chunks) == 1:
+        return _fetch_erc20_results_chunk(web3, chain_id, chunks[0])
+
+    provider = web3.provider
+    initializer = None
+    if getattr(provider, "session", None) is None and hasattr(provider, "endpoint_uri"):
+        # web3.py caches sessions per thread, hand the session of this thread to the workers
+        # so they do not each create a default one
+        session = cache_and_return_session(provider.endpoint_uri)
+        initializer = partial(cache_and_return_session, provider.endpoint_uri, session)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, POOL_SIZE, len(chunks)), initializer=initializer) as executor:
+        chunk_results = executor.map(lambda chunk: _fetch_erc20_results_chunk(web3, chain_id, chunk), chunks)
+        return [results for chunk in chunk_results for results in chunk]
+
+
+def _fetch_erc20_results_chunk(
+    web3: Web3,
+    chain_id: int,
+    erc_20s: list[Contract],
+) -> list[list[HexBytes | Exception]]:
+    """Read raw ERC-20 detail call results for several tokens in one RPC request.
+
+    Uses Multicall3 and falls back to JSON-RPC batching
+    on chains where Multicall3 is not deployed.
+
+    :return:
+        Raw results for :py:data:`_ERC20_DETAIL_FUNCTIONS`, one list per token
+    """
+    calls = [
+        (erc_20.address, erc_20.encode_abi(fn_name=fn_name))
+        for erc_20 in erc_20s
+        for fn_name in _ERC20_DETAIL_FUNCTIONS
+    ]
+
+    results = None
+    if chain_id not in _multicall_missing_chains:
+        try:
+            results = _aggregate3(web3, calls)
+        except BadFunctionCallOutput:
+            # No contract at Multicall3 address on this chain
+            _multicall_missing_chains.add(chain_id)
+
+    if results is None:
+        results = _batch_eth_call(web3, calls)
+
+    width = len(_ERC20_DETAIL_FUNCTIONS)
+    return [results[idx : idx + width] for idx in range(0, len(results), width)]
+
+
+def _decode_token_details(
+    erc_20: Contract,
+    token_address: Union[HexAddress, str],
+    results: list[HexBytes | Exception],
+    max_str_length: int,
+    raise_on_error: bool,
+    chain_id: int,
+) -> tuple[TokenDetails, bool]:
+    """Decode raw ERC-20 detail call results to :py:class:`TokenDetails`.
+
+    :return:
+        Tuple (token details, all fields decoded).
+
+        Incomplete details may come from transient node errors,
+        so they must not be persisted.
+    """
+    symbol_result, name_result, decimals_result = results
+    complete = True
+
+    try:
+        symbol = decode_call_result(erc_20, "symbol", symbol_result)[0:max_str_length]
     except _call_missing_exceptions as e:
         if raise_on_error:
             raise TokenDetailError(f"Token {token_address} missing symbol") from e
         symbol = None
+        complete = False
     except OverflowError:
         # OverflowError: Python int too large to convert to C ssize_t
         # Que?
         # Sai Stablecoin uses bytes32 instead of string for name and symbol information
         # https://etherscan.io/address/0x89d24a6b4ccb1b6faa2625fe562bdd9a23260359#readContract
         symbol = None
+        complete = False
 
     try:
-        name = erc_20.functions.name().call()[0:max_str_length]
+        name = decode_call_result(erc_20, "name", name_result)[0:max_str_length]
     except _call_missing_exceptions as e:
         if raise_on_error:
             raise TokenDetailError(f"Token {token_address} missing name") from e
         name = None
+        complete = False
     except OverflowError:
         # OverflowError: Python int too large to convert to C ssize_t
         # Que?
         # Sai Stablecoin uses bytes32 instead of string for name and symbol information
         # https://etherscan.io/address/0x89d24a6b4ccb1b6faa2625fe562bdd9a23260359#readContract
         name = None
+        complete = False
 
     try:
-        decimals = erc_20.functions.decimals().call()
+        decimals = decode_call_result(erc_20, "decimals", decimals_result)
     except _call_missing_exceptions as e:
         if raise_on_error:
             raise TokenDetailError(f"Token {token_address} missing decimals") from e
         decimals = 0
+        complete = False
 
-    try:
-        supply = erc_20.functions.totalSupply().call()
-    except _call_missing_exceptions as e:
-        if raise_on_error:
-            raise TokenDetailError(f"Token {token_address} missing totalSupply") from e
-        supply = None
+    return TokenDetails(erc_20, name, symbol, decimals, chain_id=chain_id), complete
+
+
+def fetch_erc20_details(
+    web3: Web3,
+    token_address: Union[HexAddress, str],
+    max_str_length: int = 256,
+    raise_on_error=True,
+    cache: MutableMapping | None = DEFAULT_TOKEN_CACHE,
+    chain_id: int = None,
+    store: TokenDetailStore | None = DEFAULT_TOKEN_STORE,
+) -> TokenDetails:
+    """Read token details from on-chain data.
+
+    Connect to Web3 node and do RPC calls to extract the token info.
+    We apply some sanitazation for incoming data, like length checks and removal of null bytes.
+
+    The function should not raise an exception as long as the underlying node connection does not fail.
+
+    Example:
+
+    .. code-block:: python
+
+        details = fetch_erc20_details(web3, token_address)
+        assert details.name == "Hentai books token"
+        assert details.decimals == 6
+
+    :param web3:
+        Web3 instance
+
+    :param token_address:
+        ERC-20 contract address:
+
+    :param max_str_length:
+        For input sanitisation
+
+    :param raise_on_error:
+        If set, raise `TokenDetailError` on any error instead of silently ignoring in and setting details to None.
+
+    :param cache:
+        Use this cache for cache token detail calls.
+
+        The main purpose is to easily reduce JSON-RPC API call count.
+
+        By default, we use LRU cache of 1024 entries.
+
+        Set to ``None`` to disable the cache.
+
+        Any mapping works, e.g. :py:class:`lru.LRU` or :py:class:`cachetools.Cache`.
+
+    :param chain_id:
+        Chain id hint for the cache.
+
+        If not given do ``eth_chainId`` RPC call to figure out,
+        once per Web3 instance.
+
+    :param store:
+        Persistent store consulted on in-memory cache misses,
+        before doing any RPC calls.
+
+        By default, token details are kept in ``~/.cache/uniswap-demo/tokens.db``.
+
+        Set to ``None`` to disable.
 
-    token_details = TokenDetails(erc_20, name, symbol, supply, decimals)
-    if cache is not None:
-        cache[key] = {
-            "name": name,
-            "symbol": symbol,
-            "supply": supply,
-            "decimals": decimals,
-        }
-    return token_details
+    :return:
+        Sanitised token info
+    """
+    return fetch_erc20_details_many(
+        web3,
+        [token_address],
+        max_str_length=max_str_length,
+        raise_on_error=raise_on_error,
+        cache=cache,
+        chain_id=chain_id,
+        store=store,
+    )[0]
+
+
+def fetch_erc20_details_many(
+    web3: Web3,
+    token_addresses: list[Union[HexAddress, str]],
+    max_str_length: int = 256,
+    raise_on_error=True,
+    cache: MutableMapping | None = DEFAULT_TOKEN_CACHE,
+    chain_id: int = None,
+    store: TokenDetailStore | None = DEFAULT_TOKEN_STORE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[TokenDetails]:
+    """Read details of several tokens from on-chain data.
+
+    All tokens missing from the cache and the store are read with a single Multicall3 ``eth_call``.
+    Long token lists are split to several calls, done in parallel.
+
+    Example:
+
+    .. code-block:: python
+
+        base, quote = fetch_erc20_details_many(web3, [base_token_address, quote_token_address])
+
+    See :py:func:`fetch_erc20_details` for the other parameters.
+
+    :param max_workers:
+        How many Multicall3 calls to run in parallel.
+
+        Capped at the HTTP connection pool size, :py:data:`POOL_SIZE`.
+
+    :return:
+        Sanitised token info, in the order of ``token_addresses``
+    """
+
+    if not chain_id:
+        chain_id = get_chain_id(web3)
+
+    erc20_factory = get_contract_factory(web3, "ERC20.json")
+
+    details: list[TokenDetails | None] = []
+    misses = []
+    for token_address in token_addresses:
+        address = to_checksum_address(token_address)
+        erc_20 = erc20_factory(address=address)
+        key = TokenDetails.generate_cache_key(chain_id, address)
+
+        cached = cache.get(key) if cache is not None else None
+        if cached is None and store is not None:
+            cached = store.get(chain_id, address)
+            if cached is not None and cache is not None:
+                cache[key] = cached
+
+        if cached is not None:
+            details.append(
+                TokenDetails(
+                    erc_20,
+                    cached["name"],
+                    cached["symbol"],
+                    cached["decimals"],
+                    chain_id=chain_id,
+                )
+            )
+        else:
+            details.append(None)
+            misses.append((len(details) - 1, token_address, erc_20, key))
+
+    if misses:
+        all_results = _fetch_erc20_results(web3, chain_id, [erc_20 for _, _, erc_20, _ in misses], max_workers)
+        for (idx, token_address, erc_20, key), results in zip(misses, all_results):
+            token_details, complete = _decode_token_details(erc_20, token_address, results, max_str_length, raise_on_error, chain_id)
+            cached = {
+                "name": token_details.name,
+                "symbol": token_details.symbol,
+                "decimals": token_details.decimals,
+            }
+            if cache is not None:
+                cache[key] = cached
+            if store is not None and complete:
+                store.put(chain_id, erc_20.address, cached)
+            details[idx] = token_details
+
+    return details
 
 
 def get_contract(web3: Web3, address: HexAddress, abi: str) -> Contract:
@@ -299,5 +802,5 @@ def get_contract(web3: Web3, address: HexAddress, abi: str) -> Contract:
     :return:
         Contract instance
     """
-    address = Web3.to_checksum_address(address)
-    return web3.eth.contract(abi=get_abi_by_filename(abi), address=address)
\ No newline at end of file
+    address = to_checksum_address(address)
+    return get_contract_factory(web3, abi)(address=address)
\ No newline at end of file
@@ -0,0 +1,113 @@
+import itertools
+import time
+
+import requests
+from eth_typing import HexStr
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import HTTPProvider, Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from web3.types import RPCEndpoint, RPCResponse, TxReceipt
+
+from config import JSON_RPC
+from contracts import POOL_SIZE
+
+#: Seconds before a JSON-RPC HTTP request is abandoned
+REQUEST_TIMEOUT = 30
+
+#: Seconds to wait between transaction receipt polls, the last delay repeats
+RECEIPT_POLL_DELAYS = (0.5, 1, 2, 4)
+
+
+def create_session(pool_size: int = POOL_SIZE) -> requests.Session:
+    """Create a pooled HTTP session for JSON-RPC calls.
+
+    - Connections are kept alive and reused, so we do not redo
+      TCP and TLS handshakes for every RPC call
+
+    - Failed connections are retried with a short backoff
+
+    :param pool_size:
+        Number of connections to keep open
+
+    :return:
+        Session to pass to :py:class:`PooledHTTPProvider`
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+class PooledHTTPProvider(HTTPProvider):
+    """HTTP provider that sends every request through one shared session.
+
+    web3.py v6 caches provider sessions per endpoint *and thread*,
+    so a session given to :py:class:`web3.HTTPProvider` is only used by the thread that created it
+    and other threads silently get a default 10 connection session without retries.
+    This provider posts through :py:attr:`session` directly,
+    making the pool really process-wide.
+    """
+
+    def __init__(self, endpoint_uri: str, session: requests.Session, **kwargs):
+        super().__init__(endpoint_uri, **kwargs)
+        #: Shared session used from all threads
+        self.session = session
+
+    def make_request(self, method: RPCEndpoint, params) -> RPCResponse:
+        request_data = self.encode_rpc_request(method, params)
+        response = self.session.post(self.endpoint_uri, data=request_data, **self.get_request_kwargs())
+        response.raise_for_status()
+        return self.decode_rpc_response(response.content)
+
+
+def wait_for_transaction_receipt(web3: Web3, tx_hash: HexStr | bytes, timeout: float = 120) -> TxReceipt:
+    """Wait for a transaction to be mined.
+
+    Unlike :py:meth:`web3.eth.Eth.wait_for_transaction_receipt`,
+    which polls every 0.1 seconds, backs off between polls
+    to avoid burning the RPC provider request budget while the transaction is pending.
+
+    :param web3:
+        Web3 instance
+
+    :param tx_hash:
+        Transaction hash
+
+    :param timeout:
+        Seconds to wait
+
+    :raise TimeExhausted:
+        If the transaction was not mined within ``timeout``
+
+    :return:
+        Transaction receipt
+    """
+    deadline = time.monotonic() + timeout
+    delays = itertools.chain(RECEIPT_POLL_DELAYS, itertools.repeat(RECEIPT_POLL_DELAYS[-1]))
+    while True:
+        try:
+            return web3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            pass
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeExhausted(f"Transaction {Web3.to_hex(tx_hash)} is not in the chain after {timeout} seconds")
+        time.sleep(min(next(delays), remaining))
+
+
+#: Process-wide Web3 instance, all RPC calls from all threads share its connection pool
+web3 = Web3(
+    PooledHTTPProvider(
+        JSON_RPC,
+        session=create_session(),
+        request_kwargs={"timeout": REQUEST_TIMEOUT},
+    )
+)
@@ -1,19 +1,22 @@
 import datetime
 import decimal
-import os
 import sys
 from decimal import Decimal
 
-from dotenv import load_dotenv
+from eth_abi.decoding import ContextFramesBytesIO
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
-from eth_defi.confirmation import wait_transactions_to_complete
+from eth_typing import HexStr
 from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
 from web3 import Web3
+from web3._utils.fee_utils import fee_history_priority_fee
 from web3.exceptions import TimeExhausted
 from web3.middleware import construct_sign_and_send_raw_middleware
 
-from contracts import fetch_erc20_details, get_contract
+from config import BASE_TOKEN, PRIVATE_KEY, QUOTER, QUOTE_TOKEN, SWAP_ROUTER
+from contracts import batch_rpc_request, decode_call_result, fetch_erc20_details_many, get_chain_id, get_contract
+from rpc import wait_for_transaction_receipt, web3
 
 swap_event_abi = {
     "anonymous": False,
@@ -65,45 +68,120 @@ swap_event_abi = {
     "type": "event",
 }
 
-loaded = load_dotenv(override=True)
+SWAP_EVENT_TOPIC = event_abi_to_log_topic(swap_event_abi)
 
-private_key = os.environ.get("PRIVATE_KEY")
-swap_router_addr = Web3.to_checksum_address(os.environ.get("SWAP_ROUTER"))
-qouter_addr = Web3.to_checksum_address(os.environ.get("QUOTER"))
-quote_token_addr = Web3.to_checksum_address(os.environ.get("QUOTE_TOKEN"))
-base_token_addr = Web3.to_checksum_address(os.environ.get("BASE_TOKEN"))
+#: Types of the non-indexed Swap fields, in the order they appear in log data
+SWAP_EVENT_DATA_TYPES = [arg["type"] for arg in swap_event_abi["inputs"] if not arg["indexed"]]
 
+# exactInputSingle() takes a static tuple, so its calldata is the 4 byte selector
+# followed by one 32 byte word per field, at fixed offsets
+AMOUNT_IN_OFFSET = 4 + 4 * 32
+AMOUNT_OUT_MINIMUM_OFFSET = 4 + 5 * 32
 
-account: LocalAccount = Account.from_key(private_key)
+
+def encode_exact_input_single(template: bytes, amount_in: int, amount_out_minimum: int) -> HexStr:
+    """Fill in swap amounts to pre-encoded ``exactInputSingle()`` calldata.
+
+    Token pair, fee and recipient rarely change between swaps,
+    so the full ABI encoding is done once for the template
+    and only the two amount words are rewritten.
+
+    :param template:
+        ``exactInputSingle()`` calldata encoded with the static fields set
+    """
+    calldata = bytearray(template)
+    calldata[AMOUNT_IN_OFFSET : AMOUNT_IN_OFFSET + 32] = amount_in.to_bytes(32, "big")
+    calldata[AMOUNT_OUT_MINIMUM_OFFSET : AMOUNT_OUT_MINIMUM_OFFSET + 32] = amount_out_minimum.to_bytes(32, "big")
+    return Web3.to_hex(calldata)
+
+
+account: LocalAccount = Account.from_key(PRIVATE_KEY)
 my_address = account.address
 
-json_rpc_url = os.environ.get("JSON_RPC")
-web3 = Web3(Web3.HTTPProvider(json_rpc_url))
 
 web3.middleware_onion.add(construct_sign_and_send_raw_middleware(account))
 
-base = fetch_erc20_details(web3, base_token_addr)
-quote = fetch_erc20_details(web3, quote_token_addr)
+# Resolve the decoder for the non-indexed Swap fields once,
+# instead of looking up the codec for every decoded log
+swap_data_decoder = web3.codec._registry.get_decoder(f"({','.join(SWAP_EVENT_DATA_TYPES)})")
+
+# Both tokens are read in a single RPC round-trip
+base, quote = fetch_erc20_details_many(web3, [BASE_TOKEN, QUOTE_TOKEN])
 
 # change this
 decimal_amount = Decimal(0.01)
 
-router_v2 = get_contract(web3, swap_router_addr, "SwapRouterV2.json")
-quoter_v2 = get_contract(web3, qouter_addr, "QuoterV2.json")
+router_v2 = get_contract(web3, SWAP_ROUTER, "SwapRouterV2.json")
+quoter_v2 = get_contract(web3, QUOTER, "QuoterV2.json")
+
+exact_input_single_template = HexBytes(
+    router_v2.encode_abi(
+        fn_name="exactInputSingle",
+        args=[
+            (
+                QUOTE_TOKEN,  # tokenIn
+                BASE_TOKEN,  # tokenOut
+                10000,  # fee (uint24)
+                my_address,  # recipient
+                0,  # amountIn, filled by encode_exact_input_single()
+                0,  # amountOutMinimum, filled by encode_exact_input_single()
+                0,  # sqrtPriceLimitX96 (uint160)
+            )
+        ],
+    )
+)
 
 # # Convert a human-readable number to fixed decimal with 18 decimal places
 raw_amount = quote.convert_to_raw(decimal_amount)
 
 
-quote_amount = quoter_v2.functions.quoteExactInputSingle(
-    (
-        quote_token_addr,  # tokenIn
-        base_token_addr,  # tokenOut
-        raw_amount,  # amountIn (uint256)
-        10000,  # fee (uint24)
-        0,  # sqrtPriceLimitX96 (uint160)
-    )
-).call()[0]
+quote_call_data = quoter_v2.encode_abi(
+    fn_name="quoteExactInputSingle",
+    args=[
+        (
+            QUOTE_TOKEN,  # tokenIn
+            BASE_TOKEN,  # tokenOut
+            raw_amount,  # amountIn (uint256)
+            10000,  # fee (uint24)
+            0,  # sqrtPriceLimitX96 (uint160)
+        )
+    ],
+)
+
+# Do the quote and everything build_transaction() and the signing middleware
+# would otherwise look up one by one in a single HTTP request
+quote_result, latest_block, max_priority_fee, gas_price, nonce = batch_rpc_request(
+    web3,
+    [
+        ("eth_call", [{"to": quoter_v2.address, "data": quote_call_data}, "latest"]),
+        ("eth_getBlockByNumber", ["latest", False]),
+        ("eth_maxPriorityFeePerGas", []),
+        ("eth_gasPrice", []),
+        ("eth_getTransactionCount", [my_address, "pending"]),
+    ],
+)
+quote_amount = decode_call_result(quoter_v2, "quoteExactInputSingle", quote_result)
+for result in (latest_block, nonce):
+    if isinstance(result, Exception):
+        raise result
+
+if "baseFeePerGas" in latest_block:
+    if isinstance(max_priority_fee, Exception):
+        # eth_maxPriorityFeePerGas is not supported by all nodes,
+        # estimate from fee history like web3.py does
+        max_priority_fee = fee_history_priority_fee(web3.eth)
+    else:
+        max_priority_fee = int(max_priority_fee, 16)
+    # Same fee strategy as web3.py default, 2x base fee headroom
+    fee_params = {
+        "maxFeePerGas": 2 * int(latest_block["baseFeePerGas"], 16) + max_priority_fee,
+        "maxPriorityFeePerGas": max_priority_fee,
+    }
+else:
+    # Pre-London chain, legacy transaction
+    if isinstance(gas_price, Exception):
+        raise gas_price
+    fee_params = {"gasPrice": int(gas_price, 16)}
 
 # the usd amount you convert out
 print(f"Quote amount: {quote_amount / 10 ** base.decimals}")
@@ -112,17 +190,16 @@ slippage_percentage = 5 / 100  # 0.5% slippage
 slippage_adjusted_amount = quote_amount / (1 + slippage_percentage)
 
 
-tx = router_v2.functions.exactInputSingle(
-    (
-        quote_token_addr,  # tokenIn
-        base_token_addr,  # tokenOut
-        10000,  # fee (uint24)
-        my_address,  # recipient
-        raw_amount,  # amountIn
-        int(slippage_adjusted_amount),  # amountOutMinimum
-        0,
-    )
-).build_transaction({"gas": 1_000_000, "from": my_address})
+tx = {
+    "to": router_v2.address,
+    "data": encode_exact_input_single(exact_input_single_template, raw_amount, int(slippage_adjusted_amount)),
+    "value": 0,
+    "gas": 1_000_000,
+    "from": my_address,
+    "chainId": get_chain_id(web3),
+    "nonce": int(nonce, 16),
+    **fee_params,
+}
 
 
 tx_hash = web3.eth.send_transaction(tx)
@@ -130,28 +207,23 @@ tx_hash = web3.eth.send_transaction(tx)
 
 try:
     # Wait for the transaction to be mined with a specified timeout
-    tx_receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+    tx_receipt = wait_for_transaction_receipt(web3, tx_hash, timeout=120)
     # Check the transaction status
     if tx_receipt.status == 1:
         print(f"Transaction successful with hash: {tx_receipt.transactionHash.hex()}")
         # need to check the final amount out here.
-        swap_event_signature = event_abi_to_log_topic(swap_event_abi)
-
         swap_event = next(
-            (log for log in tx_receipt.logs if log.topics[0] == swap_event_signature),
+            (log for log in tx_receipt.logs if log.topics[0] == SWAP_EVENT_TOPIC),
             None,
         )
 
         if swap_event:
-            decoded_event = web3.codec.decode(
-                ["int256", "int256", "uint160", "uint128"],
-                swap_event["data"],
+            amount0, amount1, sqrt_price_x96, liquidity, tick = swap_data_decoder(
+                ContextFramesBytesIO(swap_event["data"])
             )
 
             # Determine the actual amount out
-            amount_out = (
-                decoded_event[0] if int(decoded_event[0]) < 0 else decoded_event[1]
-            )
+            amount_out = amount0 if amount0 < 0 else amount1
 
             print(f"Actual amount out: {abs(amount_out / 10 ** base.decimals)}")
         else:
@@ -0,0 +1,142 @@
+import logging
+import sqlite3
+import threading
+import time
+from functools import cached_property
+from pathlib import Path
+from typing import Optional
+
+from eth_typing import HexAddress
+
+logger = logging.getLogger(__name__)
+
+#: Local devnet chain ids (Ganache/Hardhat 1337, Anvil/Hardhat 31337).
+#:
+#: Devnets are reset and redeploy different tokens at the same addresses,
+#: so their tokens are never persisted.
+DEV_CHAIN_IDS = frozenset({1337, 31337})
+
+#: Where token details are persisted by default
+DEFAULT_TOKEN_STORE_PATH = Path.home() / ".cache" / "uniswap-demo" / "tokens.db"
+
+
+class TokenDetailStore:
+    """Persistent on-disk cache of ERC-20 token details.
+
+    - ERC-20 name, symbol and decimals never change,
+      so once read they can be reused across process restarts
+
+    - Total supply changes over time and is not stored
+
+    - Tokens on local devnets, see :py:data:`DEV_CHAIN_IDS`, are not stored
+
+    - Backed by SQLite, the database file is created on first use
+
+    - Rows use the same dict format as the in-memory token cache
+
+    - Storage errors (unwritable home, corrupt or locked database) are logged
+      and treated as a cache miss or a skipped write, never raised
+
+    Example:
+
+    .. code-block:: python
+
+        store = TokenDetailStore(Path("/tmp/tokens.db"))
+        details = fetch_erc20_details(web3, token_address, store=store)
+    """
+
+    def __init__(self, path: Path = DEFAULT_TOKEN_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @cached_property
+    def connection(self) -> sqlite3.Connection:
+        """Open the database, creating the file and schema if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tokens (
+                chain_id INTEGER NOT NULL,
+                address TEXT NOT NULL,
+                name TEXT,
+                symbol TEXT,
+                decimals INTEGER,
+                fetched_at INTEGER NOT NULL,
+                PRIMARY KEY (chain_id, address)
+            )
+            """
+        )
+        connection.commit()
+        return connection
+
+    def get(self, chain_id: int, address: HexAddress) -> Optional[dict]:
+        """Look up stored token details.
+
+        :param chain_id:
+            EVM chain id
+
+        :param address:
+            Checksummed token address
+
+        :return:
+            Dict with keys `name`, `symbol`, `decimals` or ``None`` if not stored
+        """
+        if chain_id in DEV_CHAIN_IDS:
+            return None
+
+        try:
+            with self._lock:
+                row = self.connection.execute(
+                    "SELECT name, symbol, decimals FROM tokens WHERE chain_id = ? AND address = ?",
+                    (chain_id, address),
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not read token %s on chain %d from %s: %s", address, chain_id, self.path, e)
+            return None
+
+        if row is None:
+            return None
+
+        name, symbol, decimals = row
+        return {
+            "name": name,
+            "symbol": symbol,
+            "decimals": decimals,
+        }
+
+    def put(self, chain_id: int, address: HexAddress, details: dict):
+        """Store token details.
+
+        :param chain_id:
+            EVM chain id
+
+        :param address:
+            Checksummed token address
+
+        :param details:
+            Dict with keys `name`, `symbol`, `decimals`
+        """
+        if chain_id in DEV_CHAIN_IDS:
+            return
+
+        try:
+            with self._lock:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO tokens (chain_id, address, name, symbol, decimals, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        chain_id,
+                        address,
+                        details["name"],
+                        details["symbol"],
+                        details["decimals"],
+                        int(time.time()),
+                    ),
+                )
+                self.connection.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not store token %s on chain %d to %s: %s", address, chain_id, self.path, e)
+
+
+#: Token details store shared by the scripts
+DEFAULT_TOKEN_STORE = TokenDetailStore()